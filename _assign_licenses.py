@@ -2,7 +2,7 @@
 Assign Microsoft_365_E5 licenses to all unlicensed human users.
 Skips service accounts, conference rooms, and anyone already licensed.
 """
-import json, subprocess, urllib.request, urllib.error
+import json, shutil, subprocess, urllib.request, urllib.error
 
 SKU_ID = "18a4bd3f-0b5b-4887-b04f-61dd0ee15f5e"   # Microsoft_365_E5_(no_Teams)
 
@@ -10,9 +10,11 @@ SKIP_UPN = {"conf_apollo", "conf_gemini", "ms-serviceaccount"}
 SKIP_DISPLAY_KEYWORDS = {"service account", "bot"}
 
 def get_token():
+    # argv list, no shell; which() resolves az.cmd on Windows
     r = subprocess.run(
-        "az account get-access-token --scope https://graph.microsoft.com/.default",
-        capture_output=True, text=True, check=True, shell=True
+        [shutil.which("az") or "az", "account", "get-access-token",
+         "--scope", "https://graph.microsoft.com/.default"],
+        capture_output=True, text=True, check=True, timeout=30
     )
     return json.loads(r.stdout)["accessToken"]
 
@@ -24,30 +26,38 @@ def graph_get(token, path):
     with urllib.request.urlopen(req, timeout=20) as resp:
         return json.loads(resp.read())
 
-def graph_post(token, path, body):
-    data = json.dumps(body).encode()
+BATCH_SIZE = 20   # Graph $batch limit
+
+def graph_batch(token, requests):
+    """
+    POST up to BATCH_SIZE requests to /$batch; returns {request id: (status, body)}.
+    If the batch call itself fails, every request in it gets that HTTP error.
+    """
+    data = json.dumps({"requests": requests}).encode()
     req  = urllib.request.Request(
-        "https://graph.microsoft.com/v1.0" + path,
+        "https://graph.microsoft.com/v1.0/$batch",
         data=data, method="POST",
         headers={"Authorization": "Bearer " + token, "Content-Type": "application/json"}
     )
     try:
-        with urllib.request.urlopen(req, timeout=20) as resp:
-            return resp.status, None
+        with urllib.request.urlopen(req, timeout=60) as resp:
+            responses = json.loads(resp.read()).get("responses", [])
     except urllib.error.HTTPError as e:
-        return e.code, e.read().decode()
+        err = e.read().decode()
+        return {r["id"]: (e.code, err) for r in requests}
+    return {r["id"]: (r["status"], r.get("body")) for r in responses}
 
 def main():
     token = get_token()
 
-    data  = graph_get(token, "/users?$select=id,displayName,userPrincipalName,assignedLicenses,accountEnabled&$top=100")
+    data  = graph_get(token, "/users?$filter=accountEnabled%20eq%20true&$select=id,displayName,userPrincipalName,assignedLicenses&$top=100")
     users = [
         u for u in data.get("value", [])
-        if u.get("accountEnabled")
-        and "#EXT#" not in u["userPrincipalName"]
+        if "#EXT#" not in u["userPrincipalName"]
     ]
 
-    assigned = skipped = 0
+    ordered = []   # users to report on, in display order
+    pending = []   # users that still need the license
     for u in sorted(users, key=lambda x: x["displayName"]):
         prefix  = u["userPrincipalName"].split("@")[0].lower()
         display = u["displayName"].lower()
@@ -55,21 +65,39 @@ def main():
         if prefix in SKIP_UPN or any(k in display for k in SKIP_DISPLAY_KEYWORDS):
             continue
 
-        already = any(l["skuId"] == SKU_ID for l in u.get("assignedLicenses", []))
-        if already:
+        ordered.append(u)
+        if not any(l["skuId"] == SKU_ID for l in u.get("assignedLicenses", [])):
+            pending.append(u)
+
+    results = {}   # user id -> (status, body)
+    for start in range(0, len(pending), BATCH_SIZE):
+        chunk = pending[start:start + BATCH_SIZE]
+        batch = graph_batch(token, [
+            {
+                "id": str(i),
+                "method": "POST",
+                "url": f"/users/{u['id']}/assignLicense",
+                "headers": {"Content-Type": "application/json"},
+                "body": {"addLicenses": [{"skuId": SKU_ID}], "removeLicenses": []},
+            }
+            for i, u in enumerate(chunk)
+        ])
+        for i, u in enumerate(chunk):
+            results[u["id"]] = batch.get(str(i), (None, None))
+
+    # Report in the same order as the users, not grouped by batch
+    assigned = skipped = 0
+    for u in ordered:
+        if u["id"] not in results:
             print(f"  SKIP     {u['displayName']:<35} already licensed", flush=True)
             skipped += 1
             continue
-
-        status, err = graph_post(token, f"/users/{u['id']}/assignLicense", {
-            "addLicenses": [{"skuId": SKU_ID}],
-            "removeLicenses": []
-        })
+        status, body = results[u["id"]]
         if status in (200, 204):
             print(f"  ASSIGNED {u['displayName']:<35} {u['userPrincipalName']}", flush=True)
             assigned += 1
         else:
-            print(f"  FAILED   {u['displayName']:<35} HTTP {status}: {err}", flush=True)
+            print(f"  FAILED   {u['displayName']:<35} HTTP {status}: {body}", flush=True)
 
     print(f"\nDone. {assigned} assigned, {skipped} already had license.", flush=True)
 
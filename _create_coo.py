@@ -3,7 +3,7 @@ Create a COO user, set their manager to Julie Parker,
 then reassign Linda Hartwell, Robert Faulkner, and Pim van Denderen
 to report to the new COO.
 """
-import json, subprocess, urllib.request, urllib.error
+import json, shutil, subprocess, urllib.request, urllib.error
 
 SKU_ID = "18a4bd3f-0b5b-4887-b04f-61dd0ee15f5e"   # Microsoft_365_E5_(no_Teams)
 
@@ -31,9 +31,11 @@ COO = {
 REASSIGN_UPN_PREFIXES = ["liharwell", "rofaulkner", "pim"]
 
 def get_token():
+    # argv list, no shell; which() resolves az.cmd on Windows
     r = subprocess.run(
-        "az account get-access-token --scope https://graph.microsoft.com/.default",
-        capture_output=True, text=True, check=True, shell=True
+        [shutil.which("az") or "az", "account", "get-access-token",
+         "--scope", "https://graph.microsoft.com/.default"],
+        capture_output=True, text=True, check=True, timeout=30
     )
     return json.loads(r.stdout)["accessToken"]
 
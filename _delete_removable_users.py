@@ -4,6 +4,7 @@ Uses the same logic as _find_removable_users.py to identify targets,
 then calls DELETE /users/{id} for each one.
 """
 import json
+import shutil
 import subprocess
 import urllib.request
 import urllib.error
@@ -19,11 +20,14 @@ KEEP_UPN = {
     "jawhitfield",
     "admin",
 }
+KEEP_PREFIXES = tuple(KEEP_UPN)
 
 def get_token():
+    # argv list, no shell; which() resolves az.cmd on Windows
     r = subprocess.run(
-        "az account get-access-token --scope https://graph.microsoft.com/.default",
-        capture_output=True, text=True, check=True, shell=True
+        [shutil.which("az") or "az", "account", "get-access-token",
+         "--scope", "https://graph.microsoft.com/.default"],
+        capture_output=True, text=True, check=True, timeout=30
     )
     return json.loads(r.stdout)["accessToken"]
 
@@ -43,31 +47,39 @@ def graph_delete(token, path):
     except urllib.error.HTTPError as e:
         return e.code
 
+def is_internal_human(u):
+    upn  = u["userPrincipalName"]
+    name = u["displayName"].lower()
+    return (
+        "#EXT#" not in upn
+        and not upn.startswith("conf_")
+        and "service" not in name
+        and "bot" not in name
+    )
+
 def main():
     print("Getting token...", flush=True)
     token = get_token()
 
-    data  = graph_get(token, "/users?$select=id,displayName,userPrincipalName,assignedLicenses,accountEnabled&$top=100")
+    data  = graph_get(token, "/users?$filter=accountEnabled%20eq%20true&$select=id,displayName,userPrincipalName,assignedLicenses&$expand=directReports($select=id)&$top=100")
     raw   = data.get("value", [])
 
     users = [
         u for u in raw
-        if u.get("accountEnabled")
-        and "#EXT#" not in u["userPrincipalName"]
-        and not u["userPrincipalName"].startswith("conf_")
-        and "service" not in u["displayName"].lower()
-        and "bot" not in u["displayName"].lower()
+        if is_internal_human(u)
     ]
 
     to_delete = []
     for u in sorted(users, key=lambda x: x["displayName"]):
         lic      = len(u.get("assignedLicenses", []))
         prefix   = u["userPrincipalName"].split("@")[0].lower()
-        critical = any(prefix == k or prefix.startswith(k) for k in KEEP_UPN)
+        critical = prefix.startswith(KEEP_PREFIXES)
         if lic == 0 or critical:
             continue
-        reps    = graph_get(token, f"/users/{u['id']}/directReports?$select=id&$top=5")
-        manager = len(reps.get("value", [])) > 0
+        # A missing expansion must never read as "no reports": that would make managers look like leaves
+        if "directReports" not in u:
+            raise SystemExit(f"Graph omitted directReports for {u['userPrincipalName']}; aborting")
+        manager = len(u["directReports"]) > 0
         if not manager:
             to_delete.append(u)
 
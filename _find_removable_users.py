@@ -3,7 +3,9 @@ Find licensed leaf-node users safe to remove from the tenant.
 Leaf node = zero direct reports AND not demo-critical.
 """
 import json
+import shutil
 import subprocess
+import sys
 import urllib.request
 
 KEEP_UPN = {
@@ -17,11 +19,14 @@ KEEP_UPN = {
     "jawhitfield",  # James Whitfield   -- needs license
     "admin",
 }
+KEEP_PREFIXES = tuple(KEEP_UPN)
 
 def get_token():
+    # argv list, no shell; which() resolves az.cmd on Windows
     r = subprocess.run(
-        "az account get-access-token --scope https://graph.microsoft.com/.default",
-        capture_output=True, text=True, check=True, shell=True
+        [shutil.which("az") or "az", "account", "get-access-token",
+         "--scope", "https://graph.microsoft.com/.default"],
+        capture_output=True, text=True, check=True, timeout=30
     )
     return json.loads(r.stdout)["accessToken"]
 
@@ -31,22 +36,28 @@ def graph_get(token, path):
     with urllib.request.urlopen(req, timeout=20) as resp:
         return json.loads(resp.read())
 
+def is_internal_human(u):
+    upn  = u["userPrincipalName"]
+    name = u["displayName"].lower()
+    return (
+        "#EXT#" not in upn
+        and not upn.startswith("conf_")
+        and "service" not in name
+        and "bot" not in name
+    )
+
 def main():
     print("Getting token...", flush=True)
     token = get_token()
     print("Token OK. Fetching users...", flush=True)
 
-    data = graph_get(token, "/users?$select=id,displayName,userPrincipalName,assignedLicenses,accountEnabled&$top=100")
+    data = graph_get(token, "/users?$filter=accountEnabled%20eq%20true&$select=id,displayName,userPrincipalName,assignedLicenses&$expand=directReports($select=id)&$top=100")
     raw  = data.get("value", [])
     print(f"Graph returned {len(raw)} users", flush=True)
 
     users = [
         u for u in raw
-        if u.get("accountEnabled")
-        and "#EXT#" not in u["userPrincipalName"]
-        and not u["userPrincipalName"].startswith("conf_")
-        and "service" not in u["displayName"].lower()
-        and "bot" not in u["displayName"].lower()
+        if is_internal_human(u)
     ]
     print(f"Enabled internal humans: {len(users)}\n", flush=True)
 
@@ -54,16 +65,17 @@ def main():
     kept      = []
 
     for u in sorted(users, key=lambda x: x["displayName"]):
-        uid      = u["id"]
         lic      = len(u.get("assignedLicenses", []))
         prefix   = u["userPrincipalName"].split("@")[0].lower()
-        critical = any(prefix == k or prefix.startswith(k) for k in KEEP_UPN)
+        critical = prefix.startswith(KEEP_PREFIXES)
 
         if lic == 0:
             continue   # already unlicensed
 
-        reps    = graph_get(token, f"/users/{uid}/directReports?$select=id&$top=5")
-        n_rep   = len(reps.get("value", []))
+        # A missing expansion must never read as "no reports": that would make managers look like leaves
+        if "directReports" not in u:
+            raise SystemExit(f"Graph omitted directReports for {u['userPrincipalName']}; aborting")
+        n_rep   = len(u["directReports"])
         manager = n_rep > 0
 
         tag = "MGR" if manager else "LEAF"
@@ -80,15 +92,16 @@ def main():
 
     total_free = sum(len(u.get("assignedLicenses", [])) for u in removable)
 
-    print(f"\n{'='*65}")
-    print(f"SAFE TO REMOVE  ({len(removable)} users, {total_free} license(s) freed):")
-    for u in removable:
-        print(f"  CUT  {u['displayName']:<35}  {u['userPrincipalName']}")
+    lines = [
+        f"\n{'='*65}",
+        f"SAFE TO REMOVE  ({len(removable)} users, {total_free} license(s) freed):",
+    ]
+    lines += [f"  CUT  {u['displayName']:<35}  {u['userPrincipalName']}" for u in removable]
     if not removable:
-        print("  (none)")
+        lines.append("  (none)")
 
-    print(f"\nMUST KEEP  ({len(kept)} users):")
-    for u, why in kept:
-        print(f"  OK   {u['displayName']:<35}  {', '.join(why)}")
+    lines.append(f"\nMUST KEEP  ({len(kept)} users):")
+    lines += [f"  OK   {u['displayName']:<35}  {', '.join(why)}" for u, why in kept]
+    sys.stdout.write("\n".join(lines) + "\n")
 
 main()
@@ -1,7 +1,9 @@
-import json, subprocess, urllib.request
+import json, shutil, subprocess, urllib.request
+# argv list, no shell; which() resolves az.cmd on Windows
 r = subprocess.run(
-    "az account get-access-token --scope https://graph.microsoft.com/.default",
-    capture_output=True, text=True, check=True, shell=True
+    [shutil.which("az") or "az", "account", "get-access-token",
+     "--scope", "https://graph.microsoft.com/.default"],
+    capture_output=True, text=True, check=True, timeout=30
 )
 token = json.loads(r.stdout)["accessToken"]
 req = urllib.request.Request(
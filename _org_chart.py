@@ -1,12 +1,15 @@
 """
 Print the current M365 org chart as an ASCII tree.
 """
-import json, subprocess, urllib.request
+import json, shutil, subprocess, sys, urllib.request
+from concurrent.futures import ThreadPoolExecutor
 
 def get_token():
+    # argv list, no shell; which() resolves az.cmd on Windows
     r = subprocess.run(
-        "az account get-access-token --scope https://graph.microsoft.com/.default",
-        capture_output=True, text=True, check=True, shell=True
+        [shutil.which("az") or "az", "account", "get-access-token",
+         "--scope", "https://graph.microsoft.com/.default"],
+        capture_output=True, text=True, check=True, timeout=30
     )
     return json.loads(r.stdout)["accessToken"]
 
@@ -37,8 +40,15 @@ def main():
     children = {uid: [] for uid in humans}
     has_manager = set()
 
-    for uid in humans:
-        r = graph_get(token, f"/users/{uid}/directReports?$select=id&$top=20")
+    # Direct-report lookups are independent; overlap the round-trips
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        reports = pool.map(
+            lambda uid: graph_get(token, f"/users/{uid}/directReports?$select=id&$top=20"),
+            humans
+        )
+        reports_by_uid = dict(zip(humans, reports))
+
+    for uid, r in reports_by_uid.items():
         for rep in r.get("value", []):
             rid = rep["id"]
             if rid in humans:
@@ -47,21 +57,26 @@ def main():
 
     roots = [uid for uid in humans if uid not in has_manager]
 
-    def print_tree(uid, prefix="", is_last=True):
+    lines = ["", "Org Chart", "=" * 60]
+
+    def add_tree(uid, prefix="", is_last=True):
         u     = humans[uid]
         conn  = "└── " if is_last else "├── "
         title = u.get("jobTitle") or ""
         city  = u.get("city") or ""
         loc   = f" ({city})" if city else ""
-        print(f"{prefix}{conn}{u['displayName']} — {title}{loc}")
+        lines.append(f"{prefix}{conn}{u['displayName']} — {title}{loc}")
         child_prefix = prefix + ("    " if is_last else "│   ")
         kids = sorted(children[uid], key=lambda x: humans[x]["displayName"])
         for i, kid in enumerate(kids):
-            print_tree(kid, child_prefix, i == len(kids) - 1)
+            add_tree(kid, child_prefix, i == len(kids) - 1)
 
-    print("\nOrg Chart\n" + "="*60)
     roots_sorted = sorted(roots, key=lambda x: humans[x]["displayName"])
     for i, r in enumerate(roots_sorted):
-        print_tree(r, "", i == len(roots_sorted) - 1)
+        add_tree(r, "", i == len(roots_sorted) - 1)
+
+    # Emit the whole tree in one write instead of one print per node
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
 
 main()
@@ -37,9 +37,32 @@ import asyncio
 import json
 import random
 import re
+import sys
 from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional
 
+# Separator bars used by the report output
+_BAR_80 = "=" * 80
+_BAR_60 = "=" * 60
+_BAR_50 = "=" * 50
+_BAR_40 = "=" * 40
+_RULE_60 = "-" * 60
+_RULE_50 = "-" * 50
+
+
+async def _ask(prompt: str, default: str = "") -> str:
+    """
+    Prompt for an answer without blocking the event loop.
+
+    When stdin is not a terminal (CI, piped runs) the default is used instead,
+    so the suite never hangs waiting on input and never creates real bookings
+    unattended.
+    """
+    if not sys.stdin.isatty():
+        print(f"{prompt}{default}")
+        return default
+    return await asyncio.to_thread(input, prompt)
+
 # Import your Graph plugin and operations
 try:
     from plugins.graph_plugin import GraphPlugin
@@ -146,7 +169,7 @@ class GraphTestSuite:
     def log_test(self, test_name: str, success: bool, result: Any = None, error: str = None):
         """Log test results for summary reporting."""
         status = "✅ PASS" if success else "❌ FAIL"
-        print(f"{status} {test_name}")
+        lines = [f"{status} {test_name}"]
         
         if self.debug and result:
             # Handle different result types for logging
@@ -162,10 +185,10 @@ class GraphTestSuite:
                 except:
                     result_str = str(result)[:200] + "..."
             
-            print(f"   Result: {result_str}")
+            lines.append(f"   Result: {result_str}")
         
         if error:
-            print(f"   Error: {error}")
+            lines.append(f"   Error: {error}")
         
         self.test_results.append({
             "test": test_name,
@@ -173,7 +196,8 @@ class GraphTestSuite:
             "result": str(result) if result else None,  # Convert to string for JSON serialization
             "error": error
         })
-        print("-" * 50)
+        lines.append(_RULE_50)
+        sys.stdout.write("\n".join(lines) + "\n")
 
     # =============================================================================
     # SYSTEM & TIME TESTS
@@ -242,9 +266,16 @@ class GraphTestSuite:
             {"max_results": 5, "include_inactive_mailboxes": True},
         ]
         
-        for params in test_cases:
+        # Independent Graph calls - issue them together and report in case order
+        results = await asyncio.gather(
+            *(self.plugin.get_all_users(**params) for params in test_cases),
+            return_exceptions=True
+        )
+        
+        for params, result in zip(test_cases, results):
             try:
-                result = await self.plugin.get_all_users(**params)
+                if isinstance(result, Exception):
+                    raise result
                 success = isinstance(result, list)
                 self.log_test(f"get_all_users({params})", success, f"Found {len(result)} users")
                 
@@ -464,7 +495,7 @@ class GraphTestSuite:
                 # Print detailed conference room events if found
                 if success and result and self.debug:
                     print(f"\n📋 DETAILED CONFERENCE ROOM EVENTS ({len(result)} rooms):")
-                    print("=" * 80)
+                    print(_BAR_80)
                     
                     for i, room_record in enumerate(result, 1):
                         if isinstance(room_record, dict):
@@ -508,13 +539,13 @@ class GraphTestSuite:
                             else:
                                 print(f"   📭 No events scheduled for this room")
                             
-                            print("-" * 60)
+                            print(_RULE_60)
                     
                     print(f"\n✅ Conference Room Events Summary:")
                     print(f"   Total Rooms Checked: {len(result)}")
                     total_events = sum(room.get('event_count', 0) for room in result if isinstance(room, dict))
                     print(f"   Total Events Found: {total_events}")
-                    print("=" * 80)
+                    print(_BAR_80)
                     
             except Exception as e:
                 self.log_test(f"get_conference_room_events({params})", False, error=str(e))
@@ -586,7 +617,7 @@ class GraphTestSuite:
                     # Print detailed user calendar events if found
                     if result and self.debug:
                         print(f"\n📅 DETAILED USER CALENDAR EVENTS ({len(result)} events):")
-                        print("=" * 80)
+                        print(_BAR_80)
                         
                         for i, event in enumerate(result, 1):
                             # Handle both dict and Event object types
@@ -677,7 +708,7 @@ class GraphTestSuite:
                             else:
                                 print(f"   Attendees: None")
                             
-                            print("-" * 60)
+                            print(_RULE_60)
                         
                         print(f"\n✅ User Calendar Events Summary:")
                         print(f"   Total Events Found: {len(result)}")
@@ -688,7 +719,7 @@ class GraphTestSuite:
                         
                         print(f"   Online Meetings: {online_meetings}")
                         print(f"   Private Events: {private_events}")
-                        print("=" * 80)
+                        print(_BAR_80)
                         
             except Exception as e:
                 param_desc = "with date filter" if len(params) > 1 else "no date filter"
@@ -820,7 +851,7 @@ class GraphTestSuite:
         print(f"📧 Room email: {room_email}")
         print("⚠️  WARNING: This will create an actual meeting booking in this conference room!")
         
-        response = input("Do you want to proceed with booking? (y/N): ")
+        response = await _ask("Do you want to proceed with booking? (y/N): ")
         
         if response.lower() != 'y':
             self.log_test("book_conference_room_event", False, error="Skipped by user choice")
@@ -935,7 +966,7 @@ class GraphTestSuite:
         print(f"💬 Virtual Platform: Microsoft Teams")
         print("⚠️  WARNING: This will create an actual Teams meeting with room booking!")
         
-        response = input("Do you want to proceed? (y/N): ")
+        response = await _ask("Do you want to proceed? (y/N): ")
         
         if response.lower() != 'y':
             self.log_test("conference_room_teams_meeting", False, error="Skipped by user choice")
@@ -1061,7 +1092,7 @@ class GraphTestSuite:
         
         print("⚠️  WARNING: This will create an actual calendar event!")
         print(f"📅 Scheduled for: {start_time} to {end_time}")
-        response = input("Do you want to proceed? (y/N): ")
+        response = await _ask("Do you want to proceed? (y/N): ")
         
         if response.lower() != 'y':
             self.log_test("create_test_event", False, error="Skipped by user choice")
@@ -1141,7 +1172,7 @@ class GraphTestSuite:
         )
         
         print(f"📅 Scheduled for: {start_time} to {end_time}")
-        response = input("Do you want to proceed? (y/N): ")
+        response = await _ask("Do you want to proceed? (y/N): ")
         
         if response.lower() != 'y':
             self.log_test("create_teams_meeting", False, error="Skipped by user choice")
@@ -1224,7 +1255,7 @@ class GraphTestSuite:
         
         print(f"⚠️  WARNING: This will create {num_events} actual calendar events!")
         print("📅 Each event will be scheduled at a random time on weekdays within the next 5 business days")
-        response = input(f"Do you want to proceed with creating {num_events} events? (y/N): ")
+        response = await _ask(f"Do you want to proceed with creating {num_events} events? (y/N): ")
         
         if response.lower() != 'y':
             self.log_test("create_multiple_random_events", False, error="Skipped by user choice")
@@ -1393,7 +1424,7 @@ Generated by Microsoft Graph Plugin Test Suite | Auto-scheduled on weekdays only
     async def run_all_tests(self, include_creation_tests: bool = False):
         """Run the complete test suite."""
         print("🚀 Starting Microsoft Graph Plugin Test Suite")
-        print("=" * 60)
+        print(_BAR_60)
         
         # System tests
         print("\n📅 SYSTEM & TIME TESTS")
@@ -1439,16 +1470,16 @@ Generated by Microsoft Graph Plugin Test Suite | Auto-scheduled on weekdays only
             
             # Conference room booking tests (with user confirmation)
             print("\n🏢 CONFERENCE ROOM BOOKING TESTS (CREATES ACTUAL BOOKINGS)")
-            book_rooms = input("Test conference room booking functionality? (y/N): ")
+            book_rooms = await _ask("Test conference room booking functionality? (y/N): ")
             if book_rooms.lower() == 'y':
                 await self.test_book_conference_room_event()
                 await self.test_conference_room_teams_meeting()
             
             # Ask if user wants to create multiple random events
             print("\n🎲 MULTIPLE RANDOM EVENTS TEST")
-            create_multiple = input("Create multiple random test events for stress testing? (weekdays only) (y/N): ")
+            create_multiple = await _ask("Create multiple random test events for stress testing? (weekdays only) (y/N): ")
             if create_multiple.lower() == 'y':
-                num_events = input("How many events to create? (default: 3): ").strip()
+                num_events = (await _ask("How many events to create? (default: 3): ")).strip()
                 try:
                     num_events = int(num_events) if num_events else 3
                     num_events = max(1, min(num_events, 10))  # Limit between 1 and 10
@@ -1461,26 +1492,28 @@ Generated by Microsoft Graph Plugin Test Suite | Auto-scheduled on weekdays only
 
     def print_test_summary(self):
         """Print a summary of all test results."""
-        print("\n" + "=" * 60)
-        print("📊 TEST SUMMARY")
-        print("=" * 60)
-        
         total_tests = len(self.test_results)
         passed_tests = sum(1 for result in self.test_results if result['success'])
         failed_tests = total_tests - passed_tests
         
-        print(f"Total Tests: {total_tests}")
-        print(f"✅ Passed: {passed_tests}")
-        print(f"❌ Failed: {failed_tests}")
-        print(f"Success Rate: {(passed_tests/total_tests)*100:.1f}%")
+        lines = [
+            "\n" + _BAR_60,
+            "📊 TEST SUMMARY",
+            _BAR_60,
+            f"Total Tests: {total_tests}",
+            f"✅ Passed: {passed_tests}",
+            f"❌ Failed: {failed_tests}",
+            f"Success Rate: {(passed_tests/total_tests)*100:.1f}%",
+        ]
         
         if failed_tests > 0:
-            print(f"\n❌ FAILED TESTS:")
+            lines.append(f"\n❌ FAILED TESTS:")
             for result in self.test_results:
                 if not result['success']:
-                    print(f"   • {result['test']}: {result['error']}")
+                    lines.append(f"   • {result['test']}: {result['error']}")
         
-        print("\n🎉 Test suite completed!")
+        lines.append("\n🎉 Test suite completed!")
+        sys.stdout.write("\n".join(lines) + "\n")
         
         # Save results to file
         with open('test_results.json', 'w') as f:
@@ -1506,7 +1539,7 @@ async def quick_connection_test():
 async def conference_room_tests_only():
     """Run only conference room-related tests."""
     print("🏢 Running Conference Room Tests Only")
-    print("=" * 50)
+    print(_BAR_50)
     
     suite = GraphTestSuite(debug=True)
     
@@ -1532,12 +1565,12 @@ async def conference_room_tests_only():
         print("Would you like to test actual room booking? (Creates real meetings)")
         
         # Test room booking
-        test_booking = input("Test conference room booking? (y/N): ")
+        test_booking = await _ask("Test conference room booking? (y/N): ")
         if test_booking.lower() == 'y':
             await suite.test_book_conference_room_event()
         
         # Test hybrid meetings
-        test_hybrid = input("Test hybrid Teams + conference room meeting? (y/N): ")
+        test_hybrid = await _ask("Test hybrid Teams + conference room meeting? (y/N): ")
         if test_hybrid.lower() == 'y':
             await suite.test_conference_room_teams_meeting()
     else:
@@ -1549,7 +1582,7 @@ async def conference_room_tests_only():
 async def quick_room_availability_check():
     """Quick check of conference room availability without booking."""
     print("🔍 Quick Conference Room Availability Check")
-    print("=" * 50)
+    print(_BAR_50)
     
     suite = GraphTestSuite(debug=True)
     
@@ -1620,7 +1653,7 @@ async def multiple_random_events_test():
     await suite.test_get_all_users()
     
     # Ask for number of events
-    num_events = input("How many random weekday events to create? (1-10, default: 3): ").strip()
+    num_events = (await _ask("How many random weekday events to create? (1-10, default: 3): ")).strip()
     try:
         num_events = int(num_events) if num_events else 3
         num_events = max(1, min(num_events, 10))  # Limit between 1 and 10
@@ -1638,7 +1671,7 @@ async def multiple_random_events_test():
 async def main():
     """Main execution function with user menu."""
     print("🔧 Microsoft Graph Plugin Test Suite")
-    print("=" * 40)
+    print(_BAR_40)
     print("1. Quick Connection Test")
     print("2. User Tests Only")
     print("3. Calendar Tests Only") 
@@ -1648,7 +1681,11 @@ async def main():
     print("7. Multiple Random Events Test (Weekdays Only)")
     print("0. Exit")
     
-    choice = input("\nSelect test option (0-7): ")
+    # Allow the option on the command line (python _test_graph_operations.py 1) for unattended runs
+    if len(sys.argv) > 1:
+        choice = sys.argv[1]
+    else:
+        choice = await _ask("\nSelect test option (0-7): ", default="0")
     
     if choice == "1":
         await quick_connection_test()
@@ -1671,7 +1708,8 @@ async def main():
         return
     else:
         print("❌ Invalid choice")
-        await main()
+        if len(sys.argv) <= 1:
+            await main()
 
 
 if __name__ == "__main__":
@@ -9,7 +9,6 @@ import datetime
 import colorama
 import time
 import random
-from dotenv import load_dotenv
 
 from semantic_kernel import Kernel
 from semantic_kernel.agents import ChatCompletionAgent, ChatHistoryAgentThread
@@ -26,6 +25,7 @@ from plugins.risk_plugin import RiskPlugin
 from prompts.graph_prompts import prompts
 from utils.teams_utilities import TeamsUtilities
 from utils.thread_utilities import ThreadUtilities
+from utils.env_utilities import ensure_env_loaded
 
 # Initialize TeamsUtilities for sending messages
 teams_utils = TeamsUtilities()
@@ -36,7 +36,7 @@ from telemetry.decorators import trace_async_method, measure_performance, Teleme
 from telemetry.token_tracking import add_token_span_attributes, record_token_metrics
 from telemetry.console_output import console_info, console_debug, console_telemetry_event
  
-load_dotenv(override=True)
+ensure_env_loaded(override=True)
 
 class Agent:
     def __init__(self, session_id: str = None):
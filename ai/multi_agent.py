@@ -6,7 +6,6 @@ import json
 import logging
 from typing import Dict, List, Optional, Any
 import datetime
-from dotenv import load_dotenv
 
 from semantic_kernel import Kernel
 from semantic_kernel.agents import ChatCompletionAgent, ChatHistoryAgentThread
@@ -28,6 +27,7 @@ from agents import (
 from prompts.graph_prompts import prompts
 from utils.teams_utilities import TeamsUtilities
 from utils.thread_utilities import ThreadUtilities
+from utils.env_utilities import ensure_env_loaded
 
 # Import telemetry components
 from telemetry.config import initialize_telemetry, get_telemetry
@@ -35,7 +35,7 @@ from telemetry.decorators import trace_async_method, measure_performance, Teleme
 from telemetry.token_tracking import add_token_span_attributes, record_token_metrics
 from telemetry.console_output import console_info, console_debug, console_telemetry_event
 
-load_dotenv(override=True)
+ensure_env_loaded(override=True)
 
 # ---------------------------------------------------------------------------
 # Module-level CosmosDB singleton — created once, reused across all requests
@@ -5,6 +5,8 @@ This shows how the LLM can intelligently decide when to create Teams meetings
 based on user requests and context.
 """
 
+import sys
+
 # Example prompts and AI responses for Teams meeting integration
 
 TEAMS_MEETING_KEYWORDS = [
@@ -104,23 +106,27 @@ When a user requests meeting creation, analyze the request to determine the appr
 - "I'll book Conference Room A for your in-person team meeting..."
 """
 
+_BANNER = "=" * 50
+
 if __name__ == "__main__":
     examples = ai_meeting_decision_logic()
     
-    print("AI Meeting Decision Logic Examples")
-    print("=" * 50)
+    lines = ["AI Meeting Decision Logic Examples", _BANNER]
     
     for i, example in enumerate(examples, 1):
-        print(f"\n📝 Example {i}:")
-        print(f"User Input: \"{example['user_input']}\"")
-        print(f"Keywords Found: {example['analysis']['keywords_found']}")
-        print(f"Context: {example['analysis']['context']}")
-        print(f"Decision: {example['analysis']['decision']}")
-        print(f"Confidence: {example['analysis']['confidence']*100}%")
-        print(f"AI Response: \"{example['ai_response']}\"")
+        analysis = example['analysis']
+        lines += [
+            f"\n📝 Example {i}:",
+            f"User Input: \"{example['user_input']}\"",
+            f"Keywords Found: {analysis['keywords_found']}",
+            f"Context: {analysis['context']}",
+            f"Decision: {analysis['decision']}",
+            f"Confidence: {analysis['confidence']*100}%",
+            f"AI Response: \"{example['ai_response']}\"",
+        ]
         
-        if 'additional_params' in example['analysis']:
-            print(f"Additional Parameters: {example['analysis']['additional_params']}")
+        if 'additional_params' in analysis:
+            lines.append(f"Additional Parameters: {analysis['additional_params']}")
     
-    print(f"\nAI Decision Prompt:")
-    print(AI_MEETING_CREATION_PROMPT)
+    lines += ["\nAI Decision Prompt:", AI_MEETING_CREATION_PROMPT]
+    sys.stdout.write("\n".join(lines) + "\n")
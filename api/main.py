@@ -105,18 +105,7 @@ async def handle_card_action(action: str, data: dict, session_id: str, user_time
     Generic handler for card button actions from Teams Adaptive Cards.
     Routes to specific handlers based on action type.
     """
-    action_handlers = {
-        "book_anyway": handle_book_anyway,
-        "find_another_time": handle_reschedule,
-        "reschedule": handle_reschedule,
-        "confirm": handle_confirm,
-        "cancel": handle_cancel,
-        "view_profile": handle_view_profile,
-        "edit_meeting": handle_edit_meeting,
-        "schedule_meeting": handle_schedule_meeting,
-    }
-    
-    handler = action_handlers.get(action)
+    handler = _CARD_ACTION_HANDLERS.get(action)
     if not handler:
         return ChatModels.ChatResponse(
             response=f"Unknown action: {action}",
@@ -236,6 +225,19 @@ async def handle_schedule_meeting(action: str, data: dict, session_id: str, user
         )
 
 
+# Card action -> handler, built once at import rather than per request
+_CARD_ACTION_HANDLERS = {
+    "book_anyway": handle_book_anyway,
+    "find_another_time": handle_reschedule,
+    "reschedule": handle_reschedule,
+    "confirm": handle_confirm,
+    "cancel": handle_cancel,
+    "view_profile": handle_view_profile,
+    "edit_meeting": handle_edit_meeting,
+    "schedule_meeting": handle_schedule_meeting,
+}
+
+
 @app.post("/multi_agent_chat")
 @trace_async_method(operation_name="api.multi_agent_chat", include_args=True)
 @measure_performance("api_multi_agent_chat")
@@ -300,7 +302,7 @@ async def multi_agent_chat(message: ChatModels.Message):
             print(f"[CARD] 📤 Adding {len(cards)} card(s) to API response (session: {message.session_id})")
             response_data["cards"] = cards
             try:
-                cosmos_manager = await get_cosmos_manager()
+                cosmos_manager = get_cosmos_manager()
                 for card in cards:
                     attached = await cosmos_manager.attach_card_to_latest_assistant(message.session_id, card)
                     if attached:
@@ -484,7 +486,7 @@ async def clear_chat_history(session: ChatModels.Session):
         # TODO: Implement chat history clearing logic here
         # For now, return success as placeholder
         # This should call CosmosDBChatHistoryManager or similar to clear history
-        cosmos_manager = await get_cosmos_manager()
+        cosmos_manager = get_cosmos_manager()
         # Clear chat history for a specific session or all sessions
         # For example, clear history for a specific session ID
         await cosmos_manager.clear_chat_history(session_id=session_id)  # Pass session_id if needed
@@ -517,7 +519,7 @@ async def get_messages(session_id: str = None):
         logger.info(f"Get messages request - session_id: {session_id if session_id else 'all sessions'}")
     
     try:
-        cosmos_manager = await get_cosmos_manager()
+        cosmos_manager = get_cosmos_manager()
         
         if session_id:
             # Query specific session - use centralized storage layer method
@@ -589,7 +591,7 @@ async def get_messages(session_id: str = None):
             "details": error_detail if os.getenv("ENVIRONMENT") == "development" else "Check logs for details"
         }
 
-async def get_cosmos_manager():
+def get_cosmos_manager():
     cosmos_endpoint = os.getenv("COSMOS_ENDPOINT")
     cosmos_database = os.getenv("COSMOS_DATABASE", "AIAssistant")
     cosmos_container = os.getenv("COSMOS_CONTAINER", "ChatHistory")
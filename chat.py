@@ -6,7 +6,7 @@ import uuid
 from typing import Annotated
 import datetime
 import colorama
-from dotenv import load_dotenv
+from utils.env_utilities import ensure_env_loaded
 
 from semantic_kernel import Kernel
 from semantic_kernel.agents import ChatCompletionAgent, ChatHistoryAgentThread
@@ -52,7 +52,7 @@ maintained in a ChatHistoryAgentThread object and persisted in Azure CosmosDB.
 # ]
 async def main():
     # Load environment variables
-    load_dotenv(override=True)
+    ensure_env_loaded(override=True)
     
     # 1. Create the instance of the Kernel to register an AI service
     endpoint = os.getenv("OPENAI_ENDPOINT")
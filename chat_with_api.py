@@ -7,21 +7,22 @@ from typing import Annotated
 import datetime
 import aiohttp
 import colorama
-from dotenv import load_dotenv
+from utils.env_utilities import ensure_env_loaded
 
-load_dotenv()
+ensure_env_loaded()
 CHAT_SESSION_ID = os.getenv("CHAT_SESSION_ID")
 # exit if chat session ID is not set
 if not CHAT_SESSION_ID:
     raise ValueError("CHAT_SESSION_ID environment variable is not set")
 
 async def main():
-    while True:
-        # Call localhost:/8989/api/chat_agent with a user input
-        user_input = input("Enter your message (or 'exit' to quit): ")
-        if user_input.lower() == 'exit':
-            break
-        async with aiohttp.ClientSession() as session:
+    # One session for the whole conversation so each message reuses the open connection
+    async with aiohttp.ClientSession() as session:
+        while True:
+            # Call localhost:/8989/api/chat_agent with a user input
+            user_input = input("Enter your message (or 'exit' to quit): ")
+            if user_input.lower() == 'exit':
+                break
             async with session.post(
                 "http://localhost:8989/agent_chat",
                 json={
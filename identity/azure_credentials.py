@@ -1,9 +1,77 @@
-from azure.identity import DefaultAzureCredential, ManagedIdentityCredential, EnvironmentCredential
-from azure.core.exceptions import ClientAuthenticationError
+import os
 import re
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 
-class AzureCredentials(Exception):
-    """Custom exception for client authentication errors."""
+__all__ = ["AzureCredentials", "managed_identity_available", "get_cached_token", "peek_cached_token", "invalidate_cached_token"]
+
+
+_COSMOS_ENDPOINT_RE = re.compile(r'^https://[a-z0-9-]+\.documents\.azure\.com:443/?$', re.IGNORECASE)
+
+_IMDS_ADDRESS = ("169.254.169.254", 80)
+_imds_available = None
+
+
+def managed_identity_available():
+    """
+    Whether a managed identity endpoint can exist on this host.
+    App Service / Container Apps / Functions advertise it through IDENTITY_ENDPOINT or
+    MSI_ENDPOINT (AKS workload identity through AZURE_FEDERATED_TOKEN_FILE); VMs don't,
+    so fall back to one quick TCP check of IMDS (cached).
+    """
+    global _imds_available
+    if any(os.getenv(name) for name in ("IDENTITY_ENDPOINT", "MSI_ENDPOINT", "AZURE_FEDERATED_TOKEN_FILE")):
+        return True
+    if _imds_available is None:
+        try:
+            socket.create_connection(_IMDS_ADDRESS, timeout=0.3).close()
+            _imds_available = True
+        except OSError:
+            _imds_available = False
+    return _imds_available
+
+
+# Access tokens keyed by (credential, scope) for callers that hold their own credential
+_token_cache = {}
+_TOKEN_REFRESH_MARGIN = 300  # seconds
+
+
+def peek_cached_token(credential, scope):
+    """Return the cached token for the scope if it is still fresh, otherwise None. Never blocks."""
+    token = _token_cache.get((credential, scope))
+    if token is not None and time.time() < token.expires_on - _TOKEN_REFRESH_MARGIN:
+        return token
+    return None
+
+
+def get_cached_token(credential, scope):
+    """
+    Return an access token for the scope, asking the credential only when the cached
+    one is missing or within five minutes of expiry. May block on IMDS/az when it refreshes.
+    """
+    token = peek_cached_token(credential, scope)
+    if token is None:
+        token = credential.get_token(scope)
+        _token_cache[(credential, scope)] = token
+    return token
+
+
+def invalidate_cached_token(token):
+    """Drop a cached token the service has rejected so the next request fetches a new one."""
+    for key, cached in list(_token_cache.items()):
+        if cached.token == token:
+            _token_cache.pop(key, None)
+
+
+# First credential that passed the startup probe, shared by every caller in the process
+_cached_credential = None
+_credential_lock = threading.Lock()
+
+
+class AzureCredentials:
+    """Helpers for acquiring the process-wide Azure credential and validating endpoints."""
 
     @staticmethod
     def validate_cosmos_endpoint(endpoint):
@@ -15,14 +83,35 @@ class AzureCredentials(Exception):
         endpoint = endpoint.strip()
         
         # Check basic URL format
-        cosmos_pattern = r'^https://[a-zA-Z0-9-]+\.documents\.azure\.com:443/?$'
-        if not re.match(cosmos_pattern, endpoint):
+        if not _COSMOS_ENDPOINT_RE.match(endpoint):
             return False, f"Invalid CosmosDB URL format. Expected: https://account-name.documents.azure.com:443/"
             
         return True, endpoint
 
     @staticmethod
     def get_credential():
+        """
+        Get the process-wide Azure credential, probing for one on first use.
+        Concurrent first callers wait for a single probe instead of each hitting IMDS/az.
+        """
+        global _cached_credential
+        credential = _cached_credential
+        if credential is not None:
+            return credential
+        with _credential_lock:
+            if _cached_credential is None:
+                _cached_credential = AzureCredentials._select_credential()
+            return _cached_credential
+
+    @staticmethod
+    def invalidate():
+        """Forget the cached credential so the next get_credential() probes again."""
+        global _cached_credential
+        with _credential_lock:
+            _cached_credential = None
+
+    @staticmethod
+    def _select_credential():
         """
         Get Azure credentials with environment-aware fallback options.
         Authentication order depends on ENVIRONMENT variable:
@@ -30,7 +119,7 @@ class AzureCredentials(Exception):
         - production/azure: Managed identity first, then others
         """
         import logging
-        import os
+        from azure.core.exceptions import ClientAuthenticationError
         logger = logging.getLogger(__name__)
         
         # Check environment setting
@@ -49,8 +138,13 @@ class AzureCredentials(Exception):
             else:
                 logger.info(f"✅ CosmosDB endpoint validation passed: {result}")
         
+        # Imported here, after the cheap endpoint check, so importing this module (or failing
+        # on a bad endpoint) doesn't pull in the azure.identity/msal stack
+        from azure.identity import DefaultAzureCredential, ManagedIdentityCredential, EnvironmentCredential
+        
         # Define authentication methods based on environment
-        if environment in ["development", "local", "dev"]:
+        is_dev = environment in ["development", "local", "dev"]
+        if is_dev:
             logger.info("🔧 Using development authentication order")
             auth_methods = [
                 ("Azure CLI/DefaultAzureCredential", lambda: DefaultAzureCredential(
@@ -77,18 +171,52 @@ class AzureCredentials(Exception):
                 ))
             ]
         
-        # Try each authentication method
-        for method_name, credential_factory in auth_methods:
+        # Off Azure the managed identity probe can only time out against IMDS, so don't start it
+        if not managed_identity_available():
+            logger.info("⏭ Skipping Managed Identity: no identity endpoint on this host")
+            auth_methods = [method for method in auth_methods if method[0] != "Managed Identity"]
+        
+        def probe(method_name, credential_factory):
+            credential = credential_factory()
+            # Test the credential with appropriate timeout. In dev a working IMDS answers in well
+            # under a second; in production managed identity is usually the only working method,
+            # so give a cold-started IMDS its full time
+            timeout = 3 if method_name == "Managed Identity" and is_dev else 15
+            token = credential.get_token("https://cosmos.azure.com/.default", timeout=timeout)
+            return credential, token
+        
+        if not is_dev:
+            # Production: managed identity comes first and usually wins, so probe one at a
+            # time; later methods (az CLI subprocess etc.) only start if earlier ones fail
+            for method_name, credential_factory in auth_methods:
+                try:
+                    logger.info(f"🔑 Trying {method_name}...")
+                    credential, _ = probe(method_name, credential_factory)
+                    logger.info(f"✅ Successfully authenticated using {method_name}")
+                    return credential
+                except Exception as e:
+                    logger.warning(f"⚠ {method_name} failed: {e}")
+        else:
+            # Dev: probe every method at once so a slow failure (e.g. IMDS, last in this order)
+            # doesn't delay the others; results are still taken in preference order
+            executor = ThreadPoolExecutor(max_workers=len(auth_methods))
             try:
-                logger.info(f"🔑 Trying {method_name}...")
-                credential = credential_factory()
-                # Test the credential with appropriate timeout
-                timeout = 5 if method_name == "Managed Identity" and environment in ["development", "local", "dev"] else 15
-                token = credential.get_token("https://cosmos.azure.com/.default", timeout=timeout)
-                logger.info(f"✅ Successfully authenticated using {method_name}")
-                return credential
-            except Exception as e:
-                logger.warning(f"⚠ {method_name} failed: {e}")
+                futures = []
+                for method_name, credential_factory in auth_methods:
+                    logger.info(f"🔑 Trying {method_name}...")
+                    futures.append((method_name, executor.submit(probe, method_name, credential_factory)))
+                
+                for method_name, future in futures:
+                    try:
+                        credential, _ = future.result()
+                        logger.info(f"✅ Successfully authenticated using {method_name}")
+                        # Token reuse is left to the SDK clients' own bearer token policies
+                        return credential
+                    except Exception as e:
+                        logger.warning(f"⚠ {method_name} failed: {e}")
+            finally:
+                # Don't wait on lower-priority probes still in flight once one has won
+                executor.shutdown(wait=False, cancel_futures=True)
             
         # Provide detailed troubleshooting information
         error_msg = """
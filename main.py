@@ -1,10 +1,10 @@
 import re
 import os
 from fastapi import FastAPI, HTTPException
-from dotenv import load_dotenv
+from utils.env_utilities import ensure_env_loaded
 
 # Load environment variables from .env file
-load_dotenv()
+ensure_env_loaded()
 
 # Initialize telemetry early
 from telemetry.config import initialize_telemetry, get_logger
@@ -12,7 +12,6 @@ from telemetry.console_output import console_info, console_warning, console_erro
 
 if __name__ == "__main__":
     # Initialize OpenTelemetry
-    connection_string = os.getenv("APPLICATIONINSIGHTS_CONNECTION_STRING")
     service_name = os.getenv("TELEMETRY_SERVICE_NAME", "ai-calendar-assistant")
     service_version = os.getenv("TELEMETRY_SERVICE_VERSION", "1.0.0")
     uvicorn_timeout = os.getenv("UVICORN_TIMEOUT", "60")
@@ -1,4 +1,4 @@
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple, Type
 from pydantic import BaseModel
 from pydantic import Field
 
@@ -27,10 +27,9 @@ class ChatModels():
         cards: Optional[List[Dict[str, Any]]] = Field(default=None, description="Optional list of Adaptive Cards")
         session_id: Optional[str] = Field(default=None, description="Session ID for tracking")
 
-    def __init__(self) -> None:
-        self.models = [self.Message, self.ChatResponse]
+    MODELS = (Message, ChatResponse)
 
     # Method to get models
-    def models(self) -> List[BaseModel]:
-        return self.models
+    def models(self) -> Tuple[Type[BaseModel], ...]:
+        return self.MODELS
    
\ No newline at end of file
@@ -1,8 +1,8 @@
-from typing import List, Optional
+from typing import Optional, Tuple, Type
 from pydantic import BaseModel, Field
 
-from dotenv import load_dotenv
-load_dotenv(override=True)
+from utils.env_utilities import ensure_env_loaded
+ensure_env_loaded(override=True)
 
 
 class GraphModels():
@@ -17,10 +17,9 @@ class GraphModels():
 
 
 
-    # Init above tools and make available
-    def __init__(self) -> None:
-        self.models = [self.UserModel]
+    # Above models, made available without building a list per instance
+    MODELS = (UserModel,)
 
     # Method to get tools (for ease of use, made so class works similarly to LangChain toolkits)
-    def models(self) -> List[BaseModel]:
-        return self.models
+    def models(self) -> Tuple[Type[BaseModel], ...]:
+        return self.MODELS
@@ -1,4 +1,4 @@
-from typing import List
+from typing import Tuple, Type
 from pydantic import BaseModel
 from pydantic import Field
 
@@ -11,10 +11,9 @@ class OpenAIModels():
     class Messages(BaseModel):
         messages: list["OpenAIModels.Message"] = Field(..., description="List of messages in the chat")
 
-    def __init__(self) -> None:
-        self.models = [self.Message, self.Messages]
+    MODELS = (Message, Messages)
 
     # Method to get models
-    def models(self) -> List[BaseModel]:
-        return self.models
+    def models(self) -> Tuple[Type[BaseModel], ...]:
+        return self.MODELS
    
\ No newline at end of file
@@ -8,22 +8,60 @@ if TELEMETRY_EXPLICITLY_DISABLED:
 
 import traceback
 import asyncio
-import threading
+import random
 import time
 from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 import aiohttp
 from datetime import datetime
+from functools import lru_cache
 from typing import List, Dict, Optional, Any
-from azure.identity import DefaultAzureCredential, ManagedIdentityCredential
 from azure.core.exceptions import ClientAuthenticationError
+from identity.azure_credentials import get_cached_token, peek_cached_token, invalidate_cached_token
 
-# Load environment variables from .env file
+# orjson (pinned in requirements.txt) decodes Maps search payloads noticeably faster than
+# stdlib json; the fallback only keeps installs without it working
 try:
-    from dotenv import load_dotenv
-    load_dotenv()
+    import orjson
+    _json_loads = orjson.loads
 except ImportError:
-    # python-dotenv not installed, continue without loading .env file
-    pass
+    import json
+    _json_loads = json.loads
+
+MAPS_TOKEN_SCOPE = "https://atlas.microsoft.com/.default"
+
+# azure.identity class per credential kind; imported on first use since
+# subscription-key deployments never need it
+_CREDENTIAL_CLASSES = {
+    "default": "DefaultAzureCredential",
+    "managed_identity": "ManagedIdentityCredential",
+}
+
+# Managed identity variables reported when token acquisition fails
+_IDENTITY_ENV_KEYS = ("MSI_ENDPOINT", "IDENTITY_ENDPOINT", "IDENTITY_HEADER", "AZURE_CLIENT_ID")
+
+def _identity_env() -> Dict[str, Optional[str]]:
+    """Snapshot the managed identity environment variables in one pass."""
+    environ = os.environ
+    return {key: environ.get(key) for key in _IDENTITY_ENV_KEYS}
+
+@lru_cache(maxsize=None)
+def _get_credential(kind: str):
+    """One credential instance per kind per process, so its MSAL token cache survives between calls."""
+    import azure.identity
+    return getattr(azure.identity, _CREDENTIAL_CLASSES[kind])()
+
+async def _get_access_token(kind: str = "default", scope: str = MAPS_TOKEN_SCOPE):
+    """Return a cached access token for the scope, fetching a new one off the event loop when needed."""
+    credential = _get_credential(kind)
+    token = peek_cached_token(credential, scope)
+    if token is None:
+        token = await asyncio.get_running_loop().run_in_executor(None, get_cached_token, credential, scope)
+    return token
+
+
+# Load environment variables from .env file (once per process)
+from utils.env_utilities import ensure_env_loaded
+ensure_env_loaded()
 
 # Production-grade telemetry import with timeout and graceful fallback
 TELEMETRY_AVAILABLE = False
@@ -219,32 +257,111 @@ class AzureMapsOperations:
                  client_id: Optional[str] = None,
                  base_url: str = "https://atlas.microsoft.com",
                  timeout: int = 30,
-                 max_retries: int = 3):
-        """Initialize the fast-loading Azure Maps client."""
+                 max_retries: int = 3,
+                 session: Optional[aiohttp.ClientSession] = None,
+                 max_retry_wait: float = 10.0):
+        """
+        Initialize the fast-loading Azure Maps client.
+        
+        Pass an existing aiohttp session to share its connection pool; the caller
+        then remains responsible for closing it. max_retry_wait caps the total time
+        spent sleeping between retries of one request, since these calls sit on the
+        interactive chat path.
+        """
         self.base_url = base_url.rstrip('/')
         self.subscription_key = subscription_key or os.environ.get("AZURE_MAPS_SUBSCRIPTION_KEY")
         self.client_id = client_id or os.environ.get("AZURE_MAPS_CLIENT_ID")
         self.timeout = timeout
+        self._client_timeout = aiohttp.ClientTimeout(total=timeout)
         self.max_retries = max_retries
-        self.session = None
+        self.max_retry_wait = max_retry_wait
+        self.session = session
+        self._owns_session = session is None
         
         console_info(f"Azure Maps Operations initialized (telemetry: {'enabled' if TELEMETRY_AVAILABLE else 'disabled'})", "AzureMaps")
         
     async def __aenter__(self):
         """Async context manager entry."""
-        self.session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=self.timeout))
+        self._ensure_session()
         return self
         
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
-        if self.session:
-            await self.session.close()
+        await self.close()
     
+    def _ensure_session(self) -> aiohttp.ClientSession:
+        """Create the shared session on first use; keep-alive reuses the TLS connection to atlas."""
+        if not self.session or self.session.closed:
+            self._owns_session = True
+            self.session = aiohttp.ClientSession(
+                timeout=self._client_timeout,
+                connector=aiohttp.TCPConnector(keepalive_timeout=75, limit_per_host=8),
+            )
+        return self.session
+
+    async def _get_with_retry(self, url: str, headers: Dict[str, str], params: Dict[str, Any],
+                              token_kind: str = "default") -> aiohttp.ClientResponse:
+        """
+        GET with exponential backoff on throttling (429/503) and transient client errors.
+        Honors Retry-After when the service sends one, and gives up once the total backoff
+        would exceed max_retry_wait. A 401 on a bearer request drops the cached token and
+        retries once with a fresh one from the token_kind credential that issued it.
+        The caller owns the returned response.
+        """
+        session = self._ensure_session()
+        attempt = 0
+        waited = 0.0
+        token_refreshed = False
+        while True:
+            last_attempt = attempt >= self.max_retries
+            try:
+                # Explicit timeout so a caller-supplied session still honours this client's limit
+                response = await session.get(url, headers=headers, params=params, timeout=self._client_timeout)
+            except aiohttp.ClientError as e:
+                delay = min(10.0, 2 ** attempt) * random.uniform(0.5, 1.0)
+                if last_attempt or waited + delay > self.max_retry_wait:
+                    raise
+                console_warning(f"Azure Maps request error ({e}); retrying in {delay:.1f}s", "AzureMaps")
+                await asyncio.sleep(delay)
+                waited += delay
+                attempt += 1
+                continue
+
+            bearer = headers.get("Authorization", "")
+            if response.status == 401 and bearer.startswith("Bearer ") and not token_refreshed:
+                token_refreshed = True
+                response.release()
+                console_warning("Azure Maps rejected the cached token (401); refreshing once", "AzureMaps")
+                invalidate_cached_token(bearer[len("Bearer "):])
+                # The credential's own MSAL/CLI cache would hand back the same rejected token,
+                # so build fresh credential instances before re-acquiring
+                _get_credential.cache_clear()
+                token = await _get_access_token(token_kind)
+                headers = {**headers, "Authorization": f"Bearer {token.token}"}
+                continue
+
+            if response.status not in (429, 503) or last_attempt:
+                return response
+
+            retry_after = response.headers.get("Retry-After", "")
+            try:
+                delay = min(10.0, float(retry_after))
+            except ValueError:
+                delay = min(10.0, 2 ** attempt) * random.uniform(0.5, 1.0)
+            if waited + delay > self.max_retry_wait:
+                # Out of retry budget; hand the throttled response back to the caller
+                return response
+            response.release()
+            console_warning(f"Azure Maps throttled (HTTP {response.status}); retrying in {delay:.1f}s", "AzureMaps")
+            await asyncio.sleep(delay)
+            waited += delay
+            attempt += 1
+
     async def close(self):
-        """Close the aiohttp session."""
-        if self.session:
+        """Close the aiohttp session if this client created it."""
+        if self.session and self._owns_session:
             await self.session.close()
-            self.session = None
+        self.session = None
     
     async def diagnose_azure_maps_setup(self) -> Dict[str, Any]:
         """
@@ -265,13 +382,7 @@ class AzureMapsOperations:
         if not self.subscription_key:
             console_info("🔐 Testing managed identity authentication...", "AzureMaps")
             try:
-                credential = DefaultAzureCredential()
-                console_info("✅ DefaultAzureCredential created", "AzureMaps")
-                
-                # Test getting token
-                token = await asyncio.get_event_loop().run_in_executor(
-                    None, lambda: credential.get_token("https://atlas.microsoft.com/.default")
-                )
+                token = await _get_access_token()
                 
                 diagnosis["managed_identity_test"] = {
                     "status": "success",
@@ -344,8 +455,7 @@ class AzureMapsOperations:
         
         try:
             # Quick session check
-            if not self.session:
-                self.session = aiohttp.ClientSession()
+            self._ensure_session()
             
             # Fast auth setup - use URL parameter method
             params = {"api-version": "1.0"}
@@ -361,32 +471,20 @@ class AzureMapsOperations:
                 console_info("🔐 Attempting managed identity authentication...", "AzureMaps")
                 
                 # Debug environment variables
-                msi_endpoint = os.environ.get("MSI_ENDPOINT")
-                identity_endpoint = os.environ.get("IDENTITY_ENDPOINT")
-                identity_header = os.environ.get("IDENTITY_HEADER")
-                azure_client_id = os.environ.get("AZURE_CLIENT_ID")
+                identity_env = _identity_env()
+                for name, value in identity_env.items():
+                    console_info(f"   • {name}: {'✅ Set' if value else '❌ Not set'}", "AzureMaps")
                 
-                console_info(f"   • MSI_ENDPOINT: {'✅ Set' if msi_endpoint else '❌ Not set'}", "AzureMaps")
-                console_info(f"   • IDENTITY_ENDPOINT: {'✅ Set' if identity_endpoint else '❌ Not set'}", "AzureMaps")
-                console_info(f"   • IDENTITY_HEADER: {'✅ Set' if identity_header else '❌ Not set'}", "AzureMaps")
-                console_info(f"   • AZURE_CLIENT_ID: {'✅ Set' if azure_client_id else '❌ Not set'}", "AzureMaps")
-                
-                if not (msi_endpoint or identity_endpoint):
+                if not (identity_env["MSI_ENDPOINT"] or identity_env["IDENTITY_ENDPOINT"]):
                     console_error("❌ No managed identity endpoints found - not running in Azure environment", "AzureMaps")
                     raise Exception("Managed identity not available - must run in Azure Container App")
                 
                 try:
-                    console_info("   🔄 Creating DefaultAzureCredential...", "AzureMaps")
-                    credential = DefaultAzureCredential()
-                    console_info("   ✅ DefaultAzureCredential created successfully", "AzureMaps")
-                    
                     console_info("   🎫 Requesting access token for Azure Maps...", "AzureMaps")
                     token_scope = "https://atlas.microsoft.com/.default"
                     console_info(f"   • Token scope: {token_scope}", "AzureMaps")
                     
-                    token = await asyncio.get_event_loop().run_in_executor(
-                        None, lambda: credential.get_token(token_scope)
-                    )
+                    token = await _get_access_token(scope=token_scope)
                     
                     if token and token.token:
                         console_info(f"   ✅ Token acquired successfully!", "AzureMaps")
@@ -430,12 +528,8 @@ class AzureMapsOperations:
                     console_info("   🔄 Trying alternative credential types...", "AzureMaps")
                     
                     try:
-                        from azure.identity import ManagedIdentityCredential
                         console_info("   🧪 Testing ManagedIdentityCredential (system-assigned)...", "AzureMaps")
-                        mi_credential = ManagedIdentityCredential()
-                        mi_token = await asyncio.get_event_loop().run_in_executor(
-                            None, lambda: mi_credential.get_token(token_scope)
-                        )
+                        mi_token = await _get_access_token("managed_identity", token_scope)
                         
                         if mi_token and mi_token.token:
                             console_info("   ✅ ManagedIdentityCredential succeeded!", "AzureMaps")
@@ -465,11 +559,12 @@ class AzureMapsOperations:
             params["lat"] = 47.6062
             params["lon"] = -122.3321
             
-            async with self.session.get(url, headers=headers, params=params) as response:
+            token_kind = "managed_identity" if auth_method == "managed_identity_explicit" else "default"
+            async with await self._get_with_retry(url, headers, params, token_kind) as response:
                 duration = (datetime.now() - start_time).total_seconds()
                 
                 if response.status == 200:
-                    result = await response.json()
+                    result = await response.json(loads=_json_loads)
                     results_count = len(result.get("results", []))
                     
                     console_info(f"Connection test successful: {results_count} nearby results in {duration:.3f}s", "AzureMaps")
@@ -516,10 +611,7 @@ class AzureMapsOperations:
             params["subscription-key"] = self.subscription_key
         else:
             # Use managed identity with Authorization header
-            credential = DefaultAzureCredential()
-            token = await asyncio.get_event_loop().run_in_executor(
-                None, lambda: credential.get_token("https://atlas.microsoft.com/.default")
-            )
+            token = await _get_access_token()
             headers["Authorization"] = f"Bearer {token.token}"
             
             # Add required x-ms-client-id header for Azure Maps managed identity
@@ -528,13 +620,12 @@ class AzureMapsOperations:
             else:
                 console_error("Missing AZURE_MAPS_CLIENT_ID for managed identity authentication", "AzureMaps")
         
-        if not self.session:
-            self.session = aiohttp.ClientSession()
+        self._ensure_session()
             
         url = f"{self.base_url}/search/poi/json"
-        async with self.session.get(url, headers=headers, params=params) as response:
+        async with await self._get_with_retry(url, headers, params) as response:
             if response.status == 200:
-                result = await response.json()
+                result = await response.json(loads=_json_loads)
                 results = result.get("results", [])
                 console_info(f"Retrieved {len(results)} POI results", "AzureMaps")
                 
@@ -598,10 +689,7 @@ class AzureMapsOperations:
             params["subscription-key"] = self.subscription_key
         else:
             # Use managed identity with Authorization header
-            credential = DefaultAzureCredential()
-            token = await asyncio.get_event_loop().run_in_executor(
-                None, lambda: credential.get_token("https://atlas.microsoft.com/.default")
-            )
+            token = await _get_access_token()
             headers["Authorization"] = f"Bearer {token.token}"
             
             # Add required x-ms-client-id header for Azure Maps managed identity
@@ -610,14 +698,13 @@ class AzureMapsOperations:
             else:
                 console_error("Missing AZURE_MAPS_CLIENT_ID for managed identity authentication", "AzureMaps")
 
-        if not self.session:
-            self.session = aiohttp.ClientSession()
+        self._ensure_session()
 
         url = f"{self.base_url}/search/poi/json"
 
-        async with self.session.get(url, headers=headers, params=params) as response:
+        async with await self._get_with_retry(url, headers, params) as response:
             if response.status == 200:
-                result = await response.json()
+                result = await response.json(loads=_json_loads)
                 num_results = len(result.get("results", []))
                 console_info(f"Found {num_results} POI results for '{query}'", "AzureMaps")
                 return result
@@ -663,24 +750,20 @@ class AzureMapsOperations:
         if self.subscription_key:
             params["subscription-key"] = self.subscription_key
         else:
-            credential = DefaultAzureCredential()
-            token = await asyncio.get_event_loop().run_in_executor(
-                None, lambda: credential.get_token("https://atlas.microsoft.com/.default")
-            )
+            token = await _get_access_token()
             headers["Authorization"] = f"Bearer {token.token}"
             if self.client_id:
                 headers["x-ms-client-id"] = self.client_id
             else:
                 console_error("Missing AZURE_MAPS_CLIENT_ID for managed identity authentication", "AzureMaps")
 
-        if not self.session:
-            self.session = aiohttp.ClientSession()
+        self._ensure_session()
 
         url = f"{self.base_url}/search/fuzzy/json"
 
-        async with self.session.get(url, headers=headers, params=params) as response:
+        async with await self._get_with_retry(url, headers, params) as response:
             if response.status == 200:
-                result = await response.json()
+                result = await response.json(loads=_json_loads)
                 num_results = len(result.get("results", []))
                 console_info(f"Found {num_results} fuzzy results for '{query}'", "AzureMaps")
                 return result
@@ -712,10 +795,7 @@ class AzureMapsOperations:
             params["subscription-key"] = self.subscription_key
         else:
             try:
-                credential = DefaultAzureCredential()
-                token = await asyncio.get_event_loop().run_in_executor(
-                    None, lambda: credential.get_token("https://atlas.microsoft.com/.default")
-                )
+                token = await _get_access_token()
                 headers["Authorization"] = f"Bearer {token.token}"
                 if self.client_id:
                     headers["x-ms-client-id"] = self.client_id
@@ -725,14 +805,13 @@ class AzureMapsOperations:
                 console_error(f"Token acquisition failed in resolve_landmark: {e}", "AzureMaps")
                 return None
 
-        if not self.session:
-            self.session = aiohttp.ClientSession()
+        self._ensure_session()
 
         url = f"{self.base_url}/search/fuzzy/json"
         try:
-            async with self.session.get(url, headers=headers, params=params) as response:
+            async with await self._get_with_retry(url, headers, params) as response:
                 if response.status == 200:
-                    data = await response.json()
+                    data = await response.json(loads=_json_loads)
                     results = data.get("results", [])
                     if not results:
                         console_warning(f"No results resolving landmark '{landmark}'", "AzureMaps")
@@ -789,36 +868,24 @@ class AzureMapsOperations:
             console_info("🔐 Attempting managed identity authentication for geocoding...", "AzureMaps")
             
             # Debug environment variables for managed identity
-            msi_endpoint = os.environ.get("MSI_ENDPOINT")
-            identity_endpoint = os.environ.get("IDENTITY_ENDPOINT")
-            identity_header = os.environ.get("IDENTITY_HEADER")
-            azure_client_id = os.environ.get("AZURE_CLIENT_ID")
-            
+            identity_env = _identity_env()
             console_info(f"   • Environment check:", "AzureMaps")
-            console_info(f"     - MSI_ENDPOINT: {'✅ Available' if msi_endpoint else '❌ Missing'}", "AzureMaps")
-            console_info(f"     - IDENTITY_ENDPOINT: {'✅ Available' if identity_endpoint else '❌ Missing'}", "AzureMaps")
-            console_info(f"     - IDENTITY_HEADER: {'✅ Available' if identity_header else '❌ Missing'}", "AzureMaps")
-            console_info(f"     - AZURE_CLIENT_ID: {'✅ Available' if azure_client_id else '❌ Missing'}", "AzureMaps")
+            for name, value in identity_env.items():
+                console_info(f"     - {name}: {'✅ Available' if value else '❌ Missing'}", "AzureMaps")
             
-            if not (msi_endpoint or identity_endpoint):
+            if not (identity_env["MSI_ENDPOINT"] or identity_env["IDENTITY_ENDPOINT"]):
                 console_error("❌ Managed identity environment not detected!", "AzureMaps")
                 console_error("💡 This appears to be running outside Azure Container App", "AzureMaps")
                 console_error("💡 Deploy to Azure Container App to use managed identity", "AzureMaps")
                 return None
             
             try:
-                console_info("   🔄 Creating DefaultAzureCredential...", "AzureMaps")
-                credential = DefaultAzureCredential()
-                console_info("   ✅ DefaultAzureCredential created successfully", "AzureMaps")
-                
                 # Get token with detailed logging
                 console_info("   🎫 Requesting Azure Maps access token...", "AzureMaps")
                 token_scope = "https://atlas.microsoft.com/.default"
                 console_info(f"   • Token scope: {token_scope}", "AzureMaps")
                 
-                token = await asyncio.get_event_loop().run_in_executor(
-                    None, lambda: credential.get_token(token_scope)
-                )
+                token = await _get_access_token(scope=token_scope)
                 
                 if token and token.token:
                     console_info(f"   ✅ Token acquired successfully!", "AzureMaps")
@@ -858,8 +925,7 @@ class AzureMapsOperations:
                 console_error("     - Ensure azure-identity package is up to date", "AzureMaps")
                 return None
 
-        if not self.session:
-            self.session = aiohttp.ClientSession()
+        self._ensure_session()
 
         # Use /search/fuzzy/json — handles city/state AND landmarks/POIs (e.g. "Times Square, NY")
         url = f"{self.base_url}/search/fuzzy/json"
@@ -872,14 +938,13 @@ class AzureMapsOperations:
         console_info(f"   • Headers sent: {list(headers.keys())}", "AzureMaps")
 
         try:
-            async with self.session.get(url, headers=headers, params=params) as response:
+            async with await self._get_with_retry(url, headers, params) as response:
                 console_info(f"📡 API Response received: HTTP {response.status}", "AzureMaps")
                 
                 if response.status == 200:
                     raw_text = await response.text()
                     console_info(f"   • Raw response (first 500 chars): {raw_text[:500]}", "AzureMaps")
-                    import json as _json
-                    result = _json.loads(raw_text)
+                    result = _json_loads(raw_text)
                     console_info(f"✅ HTTP 200 from Azure Maps for query: '{query}'", "AzureMaps")
                     
                     # Check if we have results
@@ -944,7 +1009,6 @@ class AzureMapsOperations:
             console_error(f"   • Error type: {type(e).__name__}", "AzureMaps")
             console_error(f"   • City/State: {city}, {state}", "AzureMaps")
             console_error(f"   • Auth method: {'Subscription Key' if self.subscription_key else 'Managed Identity'}", "AzureMaps")
-            import traceback
-            console_error(f"   • Traceback: {traceback.format_exc()}", "AzureMaps")
+            console_error(f"   • Traceback: {traceback.format_exc(limit=-3)}", "AzureMaps")
             return None
 
@@ -9,13 +9,11 @@ if TELEMETRY_EXPLICITLY_DISABLED:
 from datetime import datetime
 import traceback
 import asyncio
-import json
 import logging
-from typing import List, Dict, Optional, Any
+import re
+from typing import TYPE_CHECKING, List, Dict, Optional, Any
 from azure.identity import ClientSecretCredential
 from msgraph import GraphServiceClient
-import msgraph
-from msgraph.generated.models.chat_message import ChatMessage
 from msgraph.generated.models.item_body import ItemBody
 from msgraph.generated.models.body_type import BodyType
 from msgraph.generated.models.user import User
@@ -26,25 +24,15 @@ from msgraph.generated.models.date_time_time_zone import DateTimeTimeZone
 from msgraph.generated.models.location import Location
 from msgraph.generated.models.attendee import Attendee
 from msgraph.generated.models.email_address import EmailAddress
-from msgraph.generated.models.online_meeting import OnlineMeeting
-from msgraph.generated.models.chat_info import ChatInfo
-from msgraph.generated.models.patterned_recurrence import PatternedRecurrence
-from msgraph.generated.models.recurrence_pattern import RecurrencePattern
-from msgraph.generated.models.recurrence_pattern_type import RecurrencePatternType
-from msgraph.generated.models.recurrence_range import RecurrenceRange
-from msgraph.generated.models.recurrence_range_type import RecurrenceRangeType
-from msgraph.generated.models.day_of_week import DayOfWeek
-
-# Load environment variables from .env file
-try:
-    from dotenv import load_dotenv
-    load_dotenv()
-except ImportError:
-    # python-dotenv not installed, continue without loading .env file
-    pass
+
+if TYPE_CHECKING:
+    from msgraph.generated.models.patterned_recurrence import PatternedRecurrence
+
+# Load environment variables from .env file (once per process)
+from utils.env_utilities import ensure_env_loaded
+ensure_env_loaded()
 
 # Production-grade telemetry import with timeout and graceful fallback
-import threading
 import time
 import concurrent.futures
 
@@ -228,6 +216,30 @@ if not TELEMETRY_AVAILABLE:
         props_str = f" | {properties}" if properties else ""
         print(f"{timestamp} TELEMETRY {prefix} {event_name}{props_str}")
 
+# Graph error categories, checked in order against the lowercased error text.
+# Each entry: (pattern, category, severity, suggested_action)
+_GRAPH_ERROR_CATEGORIES = tuple(
+    (re.compile(pattern), category, severity, action)
+    for pattern, category, severity, action in (
+        (r"forbidden|403", "permission_denied", "high",
+         "Check application permissions and user consent"),
+        (r"unauthorized|401", "authentication_failed", "high",
+         "Verify credentials and token validity"),
+        (r"not found|404", "resource_not_found", "medium",
+         "Verify resource ID and user permissions"),
+        (r"too many requests|429|throttl", "rate_limited", "medium",
+         "Implement exponential backoff retry logic"),
+        (r"mailbox not enabled", "mailbox_not_enabled", "medium",
+         "Ensure user has Exchange Online mailbox provisioned"),
+        (r"timeout|timed out", "timeout", "medium",
+         "Retry operation or check network connectivity"),
+        (r"network|connection", "network_error", "medium",
+         "Check network connectivity and DNS resolution"),
+        (r"service unavailable|503", "service_unavailable", "high",
+         "Wait and retry - Microsoft Graph service may be temporarily unavailable"),
+    )
+)
+
 class GraphOperations:
     def __init__(self, user_response_fields=["id", "givenname", "surname", "displayname", "userprincipalname", "mail", "jobtitle", "department", "manager"], calendar_response_fields=["id", "subject", "start", "end", "location", "attendees"]):
         """
@@ -276,7 +288,7 @@ class GraphOperations:
         half_length = (max_length - 3) // 2
         return f"{event_id[:half_length]}...{event_id[-half_length:]}"
 
-    def _build_recurrence(self, recurrence_dict: dict) -> PatternedRecurrence:
+    def _build_recurrence(self, recurrence_dict: dict) -> "PatternedRecurrence":
         """
         Build a PatternedRecurrence Graph SDK object from a plain dict.
 
@@ -290,6 +302,13 @@ class GraphOperations:
           start_date  : 'YYYY-MM-DD'  — optional, defaults to today
         """
         import datetime
+        # Recurrence models are only needed for recurring events; import on first use
+        from msgraph.generated.models.patterned_recurrence import PatternedRecurrence
+        from msgraph.generated.models.recurrence_pattern import RecurrencePattern
+        from msgraph.generated.models.recurrence_pattern_type import RecurrencePatternType
+        from msgraph.generated.models.recurrence_range import RecurrenceRange
+        from msgraph.generated.models.recurrence_range_type import RecurrenceRangeType
+        from msgraph.generated.models.day_of_week import DayOfWeek
 
         DAY_MAP = {
             'sunday':    DayOfWeek.Sunday,
@@ -431,7 +450,7 @@ class GraphOperations:
                 print(f"✅ Successfully retrieved {len(users)} users")
                 
                 for i, user in enumerate(users[:3]):  # Show first 3 users
-                    print(f"  👤 User {i+1}: {getattr(user, 'display_name', 'No name')} ({getattr(user, 'mail', 'No mail')})")
+                    print(f"  👤 User {i+1}: {user.display_name or 'No name'} ({user.mail or 'No mail'})")
                 
                 return {
                     'success': True,
@@ -558,23 +577,27 @@ class GraphOperations:
         Returns:
             bool: True if user appears to have mailbox properties, False otherwise
         """
+        # Resolve the attributes once; every check below reuses them
+        display_name = getattr(user, 'display_name', None) or ''
+        label = display_name or 'Unknown'
+        
         # Check if user has mail property (indicates Exchange mailbox assignment)
         if not hasattr(user, 'mail'):
-            print(f"🔍 User {getattr(user, 'display_name', 'Unknown')} has no 'mail' attribute")
+            print(f"🔍 User {label} has no 'mail' attribute")
             return False
             
-        if not self._get_user_attribute(user, 'mail'):
-            print(f"🔍 User {getattr(user, 'display_name', 'Unknown')} has empty mail property")
+        user_mail = self._get_user_attribute(user, 'mail', '')
+        if not user_mail:
+            print(f"🔍 User {label} has empty mail property")
             return False
             
         # Additional validation - ensure it's a valid email format
-        user_mail = self._get_user_attribute(user, 'mail', '')
         if '@' not in user_mail:
-            print(f"🔍 User {getattr(user, 'display_name', 'Unknown')} has invalid mail format: {user_mail}")
+            print(f"🔍 User {label} has invalid mail format: {user_mail}")
             return False
         
         # Additional checks for conference rooms and service accounts that might have slipped through
-        display_name = getattr(user, 'display_name', '').lower()
+        display_name = display_name.lower()
         mail_lower = user_mail.lower()
         
         # Check for conference room indicators
@@ -583,7 +606,7 @@ class GraphOperations:
             'conference room' in display_name or
             mail_lower.startswith('conf') or
             mail_lower.startswith('room')):
-            print(f"🔍 User {getattr(user, 'display_name', 'Unknown')} appears to be a conference room")
+            print(f"🔍 User {label} appears to be a conference room")
             return False
             
         # Check for service account indicators  
@@ -591,7 +614,7 @@ class GraphOperations:
             'service account' in display_name or
             'system account' in display_name or
             'microsoft service' in display_name):
-            print(f"🔍 User {getattr(user, 'display_name', 'Unknown')} appears to be a service account")
+            print(f"🔍 User {label} appears to be a service account")
             return False
             
         return True
@@ -611,43 +634,16 @@ class GraphOperations:
         error_str = str(error).lower()
         error_type = type(error).__name__
         
-        # Categorize common Graph API errors
-        if "forbidden" in error_str or "403" in error_str:
-            category = "permission_denied"
-            severity = "high"
-            suggested_action = "Check application permissions and user consent"
-        elif "unauthorized" in error_str or "401" in error_str:
-            category = "authentication_failed"
-            severity = "high"
-            suggested_action = "Verify credentials and token validity"
-        elif "not found" in error_str or "404" in error_str:
-            category = "resource_not_found"
-            severity = "medium"
-            suggested_action = "Verify resource ID and user permissions"
-        elif "too many requests" in error_str or "429" in error_str or "throttl" in error_str:
-            category = "rate_limited"
-            severity = "medium"
-            suggested_action = "Implement exponential backoff retry logic"
-        elif "mailbox not enabled" in error_str:
-            category = "mailbox_not_enabled"
-            severity = "medium"
-            suggested_action = "Ensure user has Exchange Online mailbox provisioned"
-        elif "timeout" in error_str or "timed out" in error_str:
-            category = "timeout"
-            severity = "medium"
-            suggested_action = "Retry operation or check network connectivity"
-        elif "network" in error_str or "connection" in error_str:
-            category = "network_error"
-            severity = "medium"
-            suggested_action = "Check network connectivity and DNS resolution"
-        elif "service unavailable" in error_str or "503" in error_str:
-            category = "service_unavailable"
-            severity = "high"
-            suggested_action = "Wait and retry - Microsoft Graph service may be temporarily unavailable"
-        else:
-            category = "unknown_error"
-            severity = "high"
-            suggested_action = "Review error details and contact support if needed"
+        # Categorize common Graph API errors (first matching pattern wins)
+        category = "unknown_error"
+        severity = "high"
+        suggested_action = "Review error details and contact support if needed"
+        for pattern, match_category, match_severity, match_action in _GRAPH_ERROR_CATEGORIES:
+            if pattern.search(error_str):
+                category = match_category
+                severity = match_severity
+                suggested_action = match_action
+                break
         
         error_info = {
             "category": category,
@@ -1905,6 +1901,7 @@ class GraphOperations:
                     )
 
             # Create Teams meeting using the Graph API with proper error handling
+            from msgraph.generated.models.online_meeting import OnlineMeeting
             online_meeting = OnlineMeeting(
                 subject=subject,
                 start_date_time=start,
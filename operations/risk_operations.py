@@ -3,7 +3,6 @@ import json
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Optional, Any
-import asyncio
 
 # CRITICAL: Check telemetry disable flag BEFORE any other imports
 TELEMETRY_EXPLICITLY_DISABLED = os.environ.get('TELEMETRY_EXPLICITLY_DISABLED', '').lower() in ('true', '1', 'yes')
@@ -11,13 +10,9 @@ TELEMETRY_EXPLICITLY_DISABLED = os.environ.get('TELEMETRY_EXPLICITLY_DISABLED',
 if TELEMETRY_EXPLICITLY_DISABLED:
     print("🚫 Telemetry explicitly disabled via environment variable")
 
-# Load environment variables from .env file
-try:
-    from dotenv import load_dotenv
-    load_dotenv()
-except ImportError:
-    # python-dotenv not installed, continue without loading .env file
-    pass
+# Load environment variables from .env file (once per process)
+from utils.env_utilities import ensure_env_loaded
+ensure_env_loaded()
 
 # Production-grade telemetry import with timeout and graceful fallback
 import threading
@@ -210,9 +205,6 @@ class RiskOperations:
         try:
             console_info(f"Looking up client summary for ID: {client_id}", "RiskOps")
             
-            # Simulate API call delay (remove in real implementation)
-            await asyncio.sleep(0.1)
-            
             # Mock API lookup
             if client_id in self._mock_client_data:
                 client_data = self._mock_client_data[client_id].copy()
@@ -258,9 +250,6 @@ class RiskOperations:
         try:
             console_info(f"Looking up risk metrics for client ID: {client_id}", "RiskOps")
             
-            # Simulate API call delay
-            await asyncio.sleep(0.1)
-            
             # Mock API lookup
             if client_id in self._mock_client_data:
                 client_data = self._mock_client_data[client_id]
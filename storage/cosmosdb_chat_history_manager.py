@@ -39,7 +39,7 @@ class CosmosDBChatHistoryManager:
                 
                 # Test the connection by attempting to read databases
                 try:
-                    list(self.client.list_databases())
+                    next(iter(self.client.list_databases(max_item_count=1)), None)
                     logger.info("✅ CosmosDB connection verified successfully")
                 except Exception as test_error:
                     logger.error(f"❌ CosmosDB connection test failed: {test_error}")
@@ -74,7 +74,7 @@ class CosmosDBChatHistoryManager:
                             logger.info("✅ Connected to CosmosDB using connection key")
                             
                             # Test the connection
-                            list(self.client.list_databases())
+                            next(iter(self.client.list_databases(max_item_count=1)), None)
                             logger.info("✅ CosmosDB connection verified with connection key")
                             
                         except Exception as key_error:
@@ -52,11 +52,40 @@ class TelemetryConsole:
             'MAGENTA': '\033[95m' if self.use_colors else '',
             'GRAY': '\033[90m' if self.use_colors else '',
         }
+        
+        # Level colors, resolved once rather than per message
+        self.level_colors = {
+            'ERROR': self.colors['RED'],
+            'WARN': self.colors['YELLOW'],
+            'INFO': self.colors['GREEN'],
+            'DEBUG': self.colors['BLUE'],
+            'TRACE': self.colors['CYAN'],
+        }
+        # Formatted level/module prefixes, built once per distinct value
+        self._level_prefixes = {}
+        self._module_tags = {}
     
     def _should_print(self, level: ConsoleLevel) -> bool:
         """Check if we should print at this level"""
         return self.enabled and level.value <= self.level.value
     
+    def _level_prefix(self, level: str) -> str:
+        """Colored, padded level label; built once per level"""
+        prefix = self._level_prefixes.get(level)
+        if prefix is None:
+            color = self.level_colors.get(level, '')
+            prefix = f"{color}{level:5}{self.colors['RESET']}"
+            self._level_prefixes[level] = prefix
+        return prefix
+    
+    def _module_tag(self, module: str) -> str:
+        """Colored module tag; built once per module name"""
+        tag = self._module_tags.get(module)
+        if tag is None:
+            tag = f"{self.colors['GRAY']}[{module}]{self.colors['RESET']}"
+            self._module_tags[module] = tag
+        return tag
+    
     def _format_message(self, level: str, message: str, module: Optional[str] = None) -> str:
         """Format a console message"""
         parts = []
@@ -67,19 +96,11 @@ class TelemetryConsole:
             parts.append(f"{self.colors['GRAY']}[{timestamp}]{self.colors['RESET']}")
         
         # Add level with color
-        level_colors = {
-            'ERROR': self.colors['RED'],
-            'WARN': self.colors['YELLOW'],
-            'INFO': self.colors['GREEN'],
-            'DEBUG': self.colors['BLUE'],
-            'TRACE': self.colors['CYAN'],
-        }
-        color = level_colors.get(level, '')
-        parts.append(f"{color}{level:5}{self.colors['RESET']}")
+        parts.append(self._level_prefix(level))
         
         # Add module if requested
         if self.include_module and module:
-            parts.append(f"{self.colors['GRAY']}[{module}]{self.colors['RESET']}")
+            parts.append(self._module_tag(module))
         
         # Add message
         parts.append(message)
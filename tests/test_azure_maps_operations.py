@@ -0,0 +1,64 @@
+"""Tests for AzureMapsOperations session handling."""
+import asyncio
+
+import pytest
+
+aiohttp = pytest.importorskip("aiohttp")
+
+from operations.azure_maps_operations import AzureMapsOperations
+
+pytestmark = pytest.mark.unit
+
+
+class _StubResponse:
+    status = 200
+    headers = {}
+
+    def release(self):
+        pass
+
+
+class _RecordingSession:
+    """Stands in for a caller-owned ClientSession and records request kwargs."""
+
+    closed = False
+
+    def __init__(self):
+        self.requests = []
+
+    async def get(self, url, **kwargs):
+        self.requests.append((url, kwargs))
+        return _StubResponse()
+
+
+def test_close_leaves_caller_session_open():
+    async def run():
+        async with aiohttp.ClientSession() as session:
+            client = AzureMapsOperations(subscription_key="test-key", session=session)
+            await client.close()
+            assert not session.closed
+            assert client.session is None
+
+    asyncio.run(run())
+
+
+def test_close_closes_owned_session():
+    async def run():
+        client = AzureMapsOperations(subscription_key="test-key")
+        session = client._ensure_session()
+        await client.close()
+        assert session.closed
+
+    asyncio.run(run())
+
+
+def test_caller_session_gets_client_timeout():
+    async def run():
+        session = _RecordingSession()
+        client = AzureMapsOperations(subscription_key="test-key", timeout=7, session=session)
+        response = await client._get_with_retry("https://atlas.example/search", {}, {"q": "x"})
+        assert response.status == 200
+        (_, kwargs), = session.requests
+        assert kwargs["timeout"].total == 7
+
+    asyncio.run(run())
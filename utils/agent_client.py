@@ -4,11 +4,12 @@ Azure OpenAI client configuration for Microsoft Agent Framework.
 Provides a configured ChatClient instance for all Agent Framework agents.
 """
 import os
-from dotenv import load_dotenv
 from azure.ai.agents.client.chat import AzureOpenAIChatClient
 from azure.identity import DefaultAzureCredential
+from identity.azure_credentials import managed_identity_available
+from utils.env_utilities import ensure_env_loaded
 
-load_dotenv(override=True)
+ensure_env_loaded(override=True)
 
 
 def create_agent_chat_client() -> AzureOpenAIChatClient:
@@ -38,7 +39,11 @@ def create_agent_chat_client() -> AzureOpenAIChatClient:
             model=deployment_name,
         )
     else:
-        credential = DefaultAzureCredential()
+        # Outside Azure there is no identity endpoint, so skip the managed identity probe
+        credential = DefaultAzureCredential(
+            exclude_managed_identity_credential=not managed_identity_available(),
+            exclude_interactive_browser_credential=True,
+        )
         client = AzureOpenAIChatClient(
             endpoint=endpoint,
             credential=credential,
@@ -0,0 +1,82 @@
+import os
+from pathlib import Path
+from typing import Optional
+
+try:
+    from dotenv import load_dotenv
+except ImportError:
+    # python-dotenv not installed, fall back to the minimal parser below
+    load_dotenv = None
+
+# Set once .env has been applied so child processes (and later imports) skip re-parsing it
+_ENV_LOADED_FLAG = "_AICA_ENV_LOADED"
+
+_loaded = False
+_loaded_with_override = False
+
+
+def _find_env_file() -> Optional[Path]:
+    """Find .env the way python-dotenv does: from this package's directory upwards."""
+    for directory in Path(__file__).resolve().parents:
+        candidate = directory / ".env"
+        if candidate.is_file():
+            return candidate
+    return None
+
+
+def _fast_load_dotenv(override: bool = False) -> None:
+    """
+    Minimal .env loader: KEY=VALUE lines, '#' comments, optional 'export ' and
+    surrounding quotes. No variable interpolation or multi-line values.
+    """
+    env_path = _find_env_file()
+    if env_path is None:
+        return
+
+    for line in env_path.read_text(encoding="utf-8").splitlines():
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        if line.startswith("export "):
+            line = line[len("export "):]
+        key, sep, value = line.partition("=")
+        if not sep:
+            continue
+        key = key.strip()
+        value = value.strip()
+        if len(value) >= 2 and value[0] == value[-1] and value[0] in ("'", '"'):
+            value = value[1:-1]
+        elif " #" in value:
+            value = value.split(" #", 1)[0].rstrip()
+        if override:
+            os.environ[key] = value
+        else:
+            os.environ.setdefault(key, value)
+
+
+def ensure_env_loaded(override: bool = False) -> None:
+    """
+    Load the .env file into os.environ at most once per process.
+
+    A later caller asking for override=True still gets one override pass, so
+    modules that rely on .env winning over the shell keep that behaviour.
+    Set FAST_DOTENV=1 to use the minimal built-in parser instead of python-dotenv.
+
+    Args:
+        override: Whether .env values should replace existing environment variables
+    """
+    global _loaded, _loaded_with_override
+
+    if _loaded_with_override or (_loaded and not override):
+        return
+    if not _loaded and not override and os.environ.get(_ENV_LOADED_FLAG):
+        _loaded = True
+        return
+
+    if load_dotenv is None or os.environ.get("FAST_DOTENV"):
+        _fast_load_dotenv(override=override)
+    else:
+        load_dotenv(override=override)
+    _loaded = True
+    _loaded_with_override = override
+    os.environ[_ENV_LOADED_FLAG] = "1"
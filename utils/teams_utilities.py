@@ -113,7 +113,9 @@ class TeamsUtilities:
         """
         try:
             async with aiohttp.ClientSession() as session:
-                await session.post(url, json=data)
+                # Release the response before the session closes
+                async with session.post(url, json=data):
+                    pass
         except Exception:
             # Silently ignore errors in fire-and-forget mode
             pass
\ No newline at end of file
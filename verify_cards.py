@@ -6,6 +6,8 @@ import json
 import httpx
 import os
 
+_RULE = "-" * 60
+
 async def test_api_cards():
     """Test card rendering through the API endpoint"""
     
@@ -15,7 +17,7 @@ async def test_api_cards():
     
     print("[TEST] Testing card rendering via API endpoint...")
     print(f"API URL: {endpoint}")
-    print("-" * 60)
+    print(_RULE)
     
     async with httpx.AsyncClient(timeout=30.0) as client:
         payload = {
@@ -9,6 +9,22 @@ import sys
 from pathlib import Path
 from datetime import datetime
 
+# Python 3.11+ ships tomllib; older interpreters can use the tomli backport
+try:
+    import tomllib
+except ImportError:
+    try:
+        import tomli as tomllib
+    except ImportError:
+        tomllib = None
+
+# version = "x.y.z" in [project], captured as prefix / major / minor / patch / closing quote
+_VERSION_RE = re.compile(r'(version\s*=\s*["\'])(\d+)\.(\d+)\.(\d+)(["\'])')
+# The same field under [tool.ai-calendar-assistant]
+_TOOL_VERSION_RE = re.compile(r'(\[tool\.ai-calendar-assistant\][\s\S]*?version\s*=\s*["\'])(\d+)\.(\d+)\.(\d+)(["\'])')
+_RELEASE_DATE_RE = re.compile(r'(release_date\s*=\s*["\'])[^"\']+(["\'])')
+_ANY_VERSION_RE = re.compile(r'version\s*=\s*["\']([^"\']+)["\']')
+
 def increment_minor_version():
     """Increment the minor version in pyproject.toml"""
     pyproject_path = Path(__file__).parent / "pyproject.toml"
@@ -21,8 +37,7 @@ def increment_minor_version():
     content = pyproject_path.read_text(encoding='utf-8')
     
     # Find the version line in [project] section
-    version_pattern = r'(version\s*=\s*["\'])(\d+)\.(\d+)\.(\d+)(["\'])'
-    version_match = re.search(version_pattern, content)
+    version_match = _VERSION_RE.search(content)
     
     if not version_match:
         print("Error: Could not find version in pyproject.toml", file=sys.stderr)
@@ -42,22 +57,20 @@ def increment_minor_version():
     
     # Replace the version in [project] section
     new_version_line = f"{prefix}{new_version}{suffix}"
-    new_content = re.sub(version_pattern, new_version_line, content, count=1)
+    new_content = _VERSION_RE.sub(new_version_line, content, count=1)
     
     # Also update the version in [tool.ai-calendar-assistant] section if it exists
-    tool_version_pattern = r'(\[tool\.ai-calendar-assistant\][\s\S]*?version\s*=\s*["\'])(\d+)\.(\d+)\.(\d+)(["\'])'
-    tool_match = re.search(tool_version_pattern, new_content)
+    tool_match = _TOOL_VERSION_RE.search(new_content)
     
     if tool_match:
         tool_prefix = tool_match.group(1)
         tool_suffix = tool_match.group(5)
         new_tool_version_line = f"{tool_prefix}{new_version}{tool_suffix}"
-        new_content = re.sub(tool_version_pattern, new_tool_version_line, new_content)
+        new_content = _TOOL_VERSION_RE.sub(new_tool_version_line, new_content)
     
     # Update release date in [tool.ai-calendar-assistant] section
     today = datetime.now().strftime("%Y-%m-%d")
-    release_date_pattern = r'(release_date\s*=\s*["\'])[^"\']+(["\'])'
-    new_content = re.sub(release_date_pattern, f'\\g<1>{today}\\g<2>', new_content)
+    new_content = _RELEASE_DATE_RE.sub(f'\\g<1>{today}\\g<2>', new_content)
     
     # Write back to file
     pyproject_path.write_text(new_content, encoding='utf-8')
@@ -75,10 +88,18 @@ def get_current_version():
         print("Error: pyproject.toml not found", file=sys.stderr)
         sys.exit(1)
     
+    if tomllib is not None:
+        with pyproject_path.open("rb") as f:
+            version = tomllib.load(f).get("project", {}).get("version")
+        if not version:
+            print("Error: Could not find version in pyproject.toml", file=sys.stderr)
+            sys.exit(1)
+        return version
+    
     content = pyproject_path.read_text(encoding='utf-8')
     
     # Look for version = "x.y.z" pattern
-    version_match = re.search(r'version\s*=\s*["\']([^"\']+)["\']', content)
+    version_match = _ANY_VERSION_RE.search(content)
     
     if not version_match:
         print("Error: Could not find version in pyproject.toml", file=sys.stderr)